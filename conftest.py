@@ -29,37 +29,39 @@ def pytest_configure(config):
     )
 
 
+# Markers applied from a substring of the test file path
+_PATH_MARKERS = (
+    ("test_performance", pytest.mark.performance),
+    ("test_error_scenarios", pytest.mark.error_handling),
+    ("test_integration", pytest.mark.integration),
+    ("test_sse_server", pytest.mark.sse),
+    ("test_mcp_tools", pytest.mark.mcp),
+)
+
+# Markers applied when any of the substrings appears in the test name
+_NAME_MARKERS = (
+    (("normalize_url",), pytest.mark.url_normalization),
+    (("security", "alert"), pytest.mark.security),
+    (("concurrent", "performance"), pytest.mark.performance),
+    (("long_running", "slow"), pytest.mark.slow),
+)
+
+
 def pytest_collection_modifyitems(config, items):
     """Automatically mark tests based on their location and name."""
     for item in items:
-        # Mark tests based on file location
-        if "test_performance" in str(item.fspath):
-            item.add_marker(pytest.mark.performance)
-
-        if "test_error_scenarios" in str(item.fspath):
-            item.add_marker(pytest.mark.error_handling)
-
-        if "test_integration" in str(item.fspath):
-            item.add_marker(pytest.mark.integration)
+        path = str(item.path)
+        name = item.name
 
-        if "test_sse_server" in str(item.fspath):
-            item.add_marker(pytest.mark.sse)
-
-        if "test_mcp_tools" in str(item.fspath):
-            item.add_marker(pytest.mark.mcp)
+        # Mark tests based on file location
+        for substring, marker in _PATH_MARKERS:
+            if substring in path:
+                item.add_marker(marker)
 
         # Mark tests based on test name patterns
-        if "normalize_url" in item.name:
-            item.add_marker(pytest.mark.url_normalization)
-
-        if "security" in item.name or "alert" in item.name:
-            item.add_marker(pytest.mark.security)
-
-        if "concurrent" in item.name or "performance" in item.name:
-            item.add_marker(pytest.mark.performance)
-
-        if "long_running" in item.name or "slow" in item.name:
-            item.add_marker(pytest.mark.slow)
+        for substrings, marker in _NAME_MARKERS:
+            if any(substring in name for substring in substrings):
+                item.add_marker(marker)
 
 
 def pytest_addoption(parser):
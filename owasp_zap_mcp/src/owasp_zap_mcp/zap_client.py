@@ -30,7 +30,7 @@ class ZAPScanStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZAPAlert:
     """Represents a ZAP security alert."""
 
@@ -44,8 +44,23 @@ class ZAPAlert:
     reference: str
     plugin_id: str
 
+    @classmethod
+    def from_dict(cls, alert_data: Dict[str, Any]) -> "ZAPAlert":
+        """Build an alert from a raw ZAP API alert dictionary."""
+        return cls(
+            alert_id=alert_data.get("id", ""),
+            name=alert_data.get("alert", ""),
+            risk=alert_data.get("risk", ""),
+            confidence=alert_data.get("confidence", ""),
+            url=alert_data.get("url", ""),
+            description=alert_data.get("description", ""),
+            solution=alert_data.get("solution", ""),
+            reference=alert_data.get("reference", ""),
+            plugin_id=alert_data.get("pluginId", ""),
+        )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZAPScanStatusResult:
     status: str
     progress: int
@@ -117,13 +132,13 @@ class ZAPClient:
 
         try:
             # Run in thread pool to avoid blocking
-            start_time = time.time()
+            start_time = time.monotonic()
 
             version = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.core.version
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 f"✅ ZAP health check passed - Version: {version} (took {duration:.2f}s)"
             )
@@ -175,13 +190,13 @@ class ZAPClient:
 
             # Start spider scan
             logger.debug(f"Initiating spider scan for {url}...")
-            start_time = time.time()
+            start_time = time.monotonic()
 
             scan_id = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.spider.scan(url)
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 f"✅ Spider scan started successfully - ID: {scan_id} (took {duration:.2f}s)"
             )
@@ -214,13 +229,13 @@ class ZAPClient:
 
             # Start active scan
             logger.debug(f"Initiating active scan for {url}...")
-            start_time = time.time()
+            start_time = time.monotonic()
 
             scan_id = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.ascan.scan(url)
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 f"✅ Active scan started successfully - ID: {scan_id} (took {duration:.2f}s)"
             )
@@ -240,13 +255,13 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             status = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.spider.status(scan_id)
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.debug(f"Spider status check completed in {duration:.2f}s")
 
             # Convert status to enum and progress
@@ -275,13 +290,13 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             status = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.ascan.status(scan_id)
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.debug(f"Active scan status check completed in {duration:.2f}s")
 
             # Convert status to enum and progress
@@ -310,14 +325,14 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Get all alerts
             alerts_data = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.core.alerts()
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.debug(f"Retrieved raw alerts data in {duration:.2f}s")
             logger.debug(f"Raw alerts count: {len(alerts_data) if alerts_data else 0}")
 
@@ -326,17 +341,7 @@ class ZAPClient:
 
             for alert_data in alerts_data:
                 try:
-                    alert = ZAPAlert(
-                        alert_id=alert_data.get("id", ""),
-                        name=alert_data.get("alert", ""),
-                        risk=alert_data.get("risk", ""),
-                        confidence=alert_data.get("confidence", ""),
-                        url=alert_data.get("url", ""),
-                        description=alert_data.get("description", ""),
-                        solution=alert_data.get("solution", ""),
-                        reference=alert_data.get("reference", ""),
-                        plugin_id=alert_data.get("pluginId", ""),
-                    )
+                    alert = ZAPAlert.from_dict(alert_data)
 
                     # Filter by risk level if specified
                     if risk_level is None or alert.risk.lower() == risk_level.lower():
@@ -374,13 +379,13 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             report = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.core.htmlreport()
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             report_size = len(report) if report else 0
 
             logger.info(
@@ -402,7 +407,7 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Get alerts and format as JSON
             alerts_data = await asyncio.get_running_loop().run_in_executor(
@@ -431,7 +436,7 @@ class ZAPClient:
 
             json_report = json.dumps(report, indent=2, ensure_ascii=False)
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             report_size = len(json_report)
 
             logger.info(
@@ -451,14 +456,14 @@ class ZAPClient:
 
         try:
             # Use asyncio.get_running_loop() instead
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Clear various ZAP data
             await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.zap.core.new_session()
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(f"✅ ZAP session cleared successfully (took {duration:.2f}s)")
 
             return True
@@ -3,24 +3,224 @@ Pytest configuration and shared fixtures for OWASP ZAP MCP tests.
 """
 
 import asyncio
-import tempfile
-from pathlib import Path
+import json
+from dataclasses import asdict
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.owasp_zap_mcp.tools import zap_tools
+from src.owasp_zap_mcp.tools.zap_tools import normalize_url
+from src.owasp_zap_mcp.zap_client import (
+    ZAPAlert,
+    ZAPClient,
+    ZAPScanStatus,
+    ZAPScanStatusResult,
+)
+
+
+def _json_report(alerts):
+    """Serialize ``alerts`` the way ZAPClient.generate_json_report returns them."""
+    return json.dumps(
+        {
+            "alerts": [asdict(alert) for alert in alerts],
+            "total_alerts": len(alerts),
+            "timestamp": "2025-05-30T16:19:30Z",
+        }
+    )
+
+
+# Default alert set and matching JSON report for mock_zap_client_factory,
+# built once so the common no-argument path does no per-call work.
+_DEFAULT_ALERTS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Test Alert",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="Test description",
+        solution="Test solution",
+        reference="",
+        plugin_id="10001",
+    ),
+)
+_DEFAULT_JSON_REPORT = _json_report(_DEFAULT_ALERTS)
+_FINISHED_STATUS = ZAPScanStatusResult(
+    status=ZAPScanStatus.COMPLETED.value, progress=100
+)
+
+# Realistic findings behind the sample_security_alerts fixture
+_SAMPLE_ALERTS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Missing X-Frame-Options Header",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="X-Frame-Options header is not included in the response",
+        solution="Add X-Frame-Options header",
+        reference="",
+        plugin_id="10001",
+    ),
+    ZAPAlert(
+        alert_id="2",
+        name="Content Security Policy (CSP) Header Not Set",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="Content Security Policy header is missing",
+        solution="Implement Content Security Policy",
+        reference="",
+        plugin_id="10002",
+    ),
+    ZAPAlert(
+        alert_id="3",
+        name="Information Disclosure - Sensitive Information in URL",
+        risk="Informational",
+        confidence="Medium",
+        url="https://example.com/contact",
+        description="The response contains sensitive information",
+        solution="Review information disclosure",
+        reference="",
+        plugin_id="10003",
+    ),
+    ZAPAlert(
+        alert_id="4",
+        name="Strict-Transport-Security Header Not Set",
+        risk="Low",
+        confidence="High",
+        url="https://example.com/",
+        description="HSTS header is missing",
+        solution="Implement HSTS header",
+        reference="",
+        plugin_id="10004",
+    ),
+)
+
+
+class _StubZAP:
+    """Lightweight async stand-in for ZAPClient.
+
+    Methods whose calls tests never inspect are plain coroutines returning
+    the preset ``health_status``, ``scan_status``, ``html_report`` and
+    ``json_report`` attributes (an exception instance is raised instead);
+    tests may reassign these mid-test. spider_scan, active_scan and
+    get_alerts are AsyncMocks so their call arguments can still be
+    asserted on.
+    """
+
+    def __init__(
+        self,
+        *,
+        health_status,
+        spider_scan_id,
+        active_scan_id,
+        alerts,
+        html_report,
+        json_report,
+        scan_status,
+    ):
+        self.health_status = health_status
+        self.html_report = html_report
+        self.json_report = json_report
+        self.scan_status = scan_status
+        self.spider_scan = AsyncMock(return_value=spider_scan_id)
+        self.active_scan = AsyncMock(return_value=active_scan_id)
+        self.get_alerts = AsyncMock(return_value=alerts)
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    @staticmethod
+    def _resolve(value):
+        if isinstance(value, BaseException):
+            raise value
+        return value
 
+    async def __aenter__(self):
+        return self
 
-@pytest.fixture
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def health_check(self):
+        return self._resolve(self.health_status)
+
+    async def clear_session(self):
+        return True
+
+    async def get_spider_status(self, scan_id):
+        return self._resolve(self.scan_status)
+
+    async def get_active_scan_status(self, scan_id):
+        return self._resolve(self.scan_status)
+
+    async def generate_html_report(self):
+        return self._resolve(self.html_report)
+
+    async def generate_json_report(self):
+        return self._resolve(self.json_report)
+
+
+class _ClientContext:
+    """Async context manager that yields a preset client."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    async def __aenter__(self):
+        return self.inner
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _ZAPClientStandIn:
+    """Replacement for the ZAPClient class that hands out the current client."""
+
+    def __init__(self):
+        self.client = None
+
+    def __call__(self, *args, **kwargs):
+        return _ClientContext(self.client)
+
+    def install(self, client=None):
+        """Make ``client`` the one tools receive.
+
+        Defaults to a fresh ``AsyncMock(spec=ZAPClient)``, so tools calling a
+        method the real client lacks fail instead of getting a child mock.
+        """
+        self.client = AsyncMock(spec=ZAPClient) if client is None else client
+        return self.client
+
+
+@pytest.fixture(scope="module")
+def zap_client_class():
+    """Replace ZAPClient in the MCP tools once per test module.
+
+    The patch is shared, but _fresh_zap_client installs a new client before
+    every test, so no mock state carries over between tests. Tests call
+    ``zap_client_class.install()`` to configure their own client.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        stand_in = _ZAPClientStandIn()
+        mp.setattr(zap_tools, "ZAPClient", stand_in)
+        yield stand_in
+
+
+@pytest.fixture(autouse=True)
+def _fresh_zap_client(request):
+    """Give each test using zap_client_class a fresh client."""
+    if "zap_client_class" in request.fixturenames:
+        request.getfixturevalue("zap_client_class").install()
+
+
+@pytest.fixture(scope="session")
 def mock_zap_client_factory():
-    """Factory for creating mock ZAP clients with different configurations."""
+    """Factory for creating mock ZAP clients with different configurations.
+
+    The factory itself holds no state, so it is shared across the session;
+    every call still returns a brand-new mock client.
+    """
 
     def _create_mock_client(
         health_status=True,
@@ -30,131 +230,36 @@ def mock_zap_client_factory():
         html_report="<html>Test Report</html>",
         json_report=None,
     ):
-        mock_client = AsyncMock()
-
-        # Basic responses
-        mock_client.health_check.return_value = health_status
-        mock_client.clear_session.return_value = True
-        mock_client.spider_scan.return_value = spider_scan_id
-        mock_client.active_scan.return_value = active_scan_id
-
-        # Alerts
         if alerts is None:
-            from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-            alerts = [
-                ZAPAlert(
-                    {
-                        "name": "Test Alert",
-                        "risk": "Medium",
-                        "confidence": "High",
-                        "description": "Test description",
-                        "url": "https://example.com/",
-                        "solution": "Test solution",
-                    }
-                ),
-            ]
-        mock_client.get_alerts.return_value = alerts
-
-        # Reports
-        mock_client.generate_html_report.return_value = html_report
-
-        if json_report is None:
-            json_report = {
-                "alerts": [alert.__dict__ for alert in alerts],
-                "total_alerts": len(alerts),
-                "timestamp": "2025-05-30T16:19:30Z",
-            }
-        mock_client.generate_json_report.return_value = json_report
-
-        # Scan status
-        from src.owasp_zap_mcp.zap_client import ZAPScanStatus
-
-        mock_client.get_spider_status.return_value = ZAPScanStatus(
-            status="FINISHED", progress=100
+            alerts = list(_DEFAULT_ALERTS)
+            if json_report is None:
+                json_report = _DEFAULT_JSON_REPORT
+        elif json_report is None:
+            json_report = _json_report(alerts)
+
+        return _StubZAP(
+            health_status=health_status,
+            spider_scan_id=spider_scan_id,
+            active_scan_id=active_scan_id,
+            alerts=alerts,
+            html_report=html_report,
+            json_report=json_report,
+            scan_status=_FINISHED_STATUS,
         )
-        mock_client.get_active_scan_status.return_value = ZAPScanStatus(
-            status="FINISHED", progress=100
-        )
-
-        return mock_client
 
     return _create_mock_client
 
 
 @pytest.fixture
-def temp_reports_directory():
+def temp_reports_directory(tmp_path_factory):
     """Create a temporary directory for test reports."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        reports_dir = Path(temp_dir) / "test_reports"
-        reports_dir.mkdir(exist_ok=True)
-        yield reports_dir
+    return tmp_path_factory.mktemp("test_reports")
 
 
 @pytest.fixture
 def sample_security_alerts():
     """Provide sample security alerts for testing."""
-    from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-    return [
-        ZAPAlert(
-            {
-                "name": "Missing X-Frame-Options Header",
-                "risk": "Medium",
-                "confidence": "High",
-                "description": "X-Frame-Options header is not included in the response",
-                "url": "https://example.com/",
-                "solution": "Add X-Frame-Options header",
-            }
-        ),
-        ZAPAlert(
-            {
-                "name": "Content Security Policy (CSP) Header Not Set",
-                "risk": "Medium",
-                "confidence": "High",
-                "description": "Content Security Policy header is missing",
-                "url": "https://example.com/",
-                "solution": "Implement Content Security Policy",
-            }
-        ),
-        ZAPAlert(
-            {
-                "name": "Information Disclosure - Sensitive Information in URL",
-                "risk": "Informational",
-                "confidence": "Medium",
-                "description": "The response contains sensitive information",
-                "url": "https://example.com/contact",
-                "solution": "Review information disclosure",
-            }
-        ),
-        ZAPAlert(
-            {
-                "name": "Strict-Transport-Security Header Not Set",
-                "risk": "Low",
-                "confidence": "High",
-                "description": "HSTS header is missing",
-                "url": "https://example.com/",
-                "solution": "Implement HSTS header",
-            }
-        ),
-    ]
-
-
-@pytest.fixture
-def url_normalization_test_cases():
-    """Provide test cases for URL normalization."""
-    return [
-        ("example.com", "https://example.com"),
-        ("httpbin.org", "https://httpbin.org"),
-        ("api.example.com", "https://api.example.com"),
-        ("localhost:3000", "localhost:3000"),  # No dot, not normalized
-        ("127.0.0.1:8080", "https://127.0.0.1:8080"),  # Has dot, gets normalized
-        ("example.com/api/v1", "https://example.com/api/v1"),
-        ("https://already-https.com", "https://already-https.com"),
-        ("http://keep-http.com", "http://keep-http.com"),
-        ("", ""),
-        (None, ""),
-    ]
+    return list(_SAMPLE_ALERTS)
 
 
 @pytest.fixture
@@ -192,41 +297,53 @@ def realistic_scan_results():
     }
 
 
-@pytest.fixture
+_LOAD_TEST_URLS = (
+    "example.com",
+    "test.org",
+    "demo.net",
+    "sample.io",
+    "website.com",
+)
+
+
+@pytest.fixture(scope="session")
 def performance_test_data():
-    """Provide test data for performance testing."""
-    return {
-        "concurrent_operations": 10,
-        "large_dataset_size": 1000,
-        "timeout_threshold": 5.0,
-        "memory_test_iterations": 50,
-        "load_test_urls": [
-            "example.com",
-            "test.org",
-            "demo.net",
-            "sample.io",
-            "website.com",
-        ],
-    }
+    """Provide test data for performance testing.
+
+    Shared by the whole session, so the mapping is read-only.
+    """
+    return MappingProxyType(
+        {
+            "concurrent_operations": 10,
+            "large_dataset_size": 1000,
+            "timeout_threshold": 5.0,
+            "memory_test_iterations": 50,
+            "load_test_urls": _LOAD_TEST_URLS,
+            # (original, normalized) pairs, normalized once per session
+            "normalized_load_test_urls": tuple(
+                (url, normalize_url(url)) for url in _LOAD_TEST_URLS
+            ),
+        }
+    )
 
 
 @pytest.fixture
 def error_scenarios():
     """Provide common error scenarios for testing."""
     return {
-        "connection_errors": [
+        "connection_errors": (
             ConnectionError("ZAP is not running"),
             ConnectionError("Connection refused"),
             ConnectionError("Network unreachable"),
-        ],
-        "api_errors": [
+        ),
+        "api_errors": (
             RuntimeError("ZAP API error: Invalid URL format"),
             RuntimeError("ZAP API error: Scan not allowed"),
             RuntimeError("Invalid scan ID: 999"),
-        ],
-        "timeout_errors": [
+        ),
+        "timeout_errors": (
             asyncio.TimeoutError("Spider scan timeout"),
             asyncio.TimeoutError("Active scan timeout"),
             asyncio.TimeoutError("Health check timeout"),
-        ],
+        ),
     }
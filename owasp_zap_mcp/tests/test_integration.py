@@ -6,9 +6,7 @@ Tests covering the complete workflow from MCP tools to report generation.
 
 import asyncio
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import asdict
 
 import pytest
 
@@ -22,6 +20,179 @@ from src.owasp_zap_mcp.tools.zap_tools import (
     mcp_zap_scan_summary,
     mcp_zap_spider_scan,
 )
+from src.owasp_zap_mcp.zap_client import ZAPAlert
+
+
+def _payload(result):
+    """Decode the JSON body of an MCP tool result."""
+    return json.loads(result["content"][0]["text"])
+
+
+async def _basic_workflow(target_url):
+    """Run health check, spider scan and alert fetch; return decoded payloads.
+
+    The steps run in order: the health check gates the scan, and alerts are
+    only fetched once the spider has been started.
+    """
+    health_result = await mcp_zap_health_check()
+    spider_result = await mcp_zap_spider_scan(target_url)
+    alerts_result = await mcp_zap_get_alerts()
+    return _payload(health_result), _payload(spider_result), _payload(alerts_result)
+
+
+# Findings reported by the mocked example.com workflow scan
+_WORKFLOW_ALERTS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Missing X-Frame-Options Header",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="X-Frame-Options header is not included in the response",
+        solution="Add X-Frame-Options header",
+        reference="",
+        plugin_id="10001",
+    ),
+    ZAPAlert(
+        alert_id="2",
+        name="Content Security Policy (CSP) Header Not Set",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="Content Security Policy header is missing",
+        solution="Implement Content Security Policy",
+        reference="",
+        plugin_id="10002",
+    ),
+    ZAPAlert(
+        alert_id="3",
+        name="Information Disclosure - Sensitive Information in URL",
+        risk="Informational",
+        confidence="Medium",
+        url="https://example.com/contact",
+        description="The response contains sensitive information",
+        solution="Review information disclosure",
+        reference="",
+        plugin_id="10003",
+    ),
+)
+
+# HTML report returned by the mocked example.com workflow scan
+_WORKFLOW_HTML_REPORT = """
+<!DOCTYPE html>
+<html>
+<head><title>ZAP Security Report</title></head>
+<body>
+    <h1>Security Assessment Report</h1>
+    <h2>Target: https://example.com</h2>
+    <h3>Summary</h3>
+    <p>3 issues found</p>
+    <h3>Findings</h3>
+    <ul>
+        <li>Missing X-Frame-Options Header (Medium)</li>
+        <li>Content Security Policy Header Not Set (Medium)</li>
+        <li>Information Disclosure (Informational)</li>
+    </ul>
+</body>
+</html>
+"""
+
+# Serialized JSON report matching _WORKFLOW_ALERTS
+_WORKFLOW_JSON_REPORT = json.dumps(
+    {
+        "target": "https://example.com",
+        "alerts": [asdict(alert) for alert in _WORKFLOW_ALERTS],
+        "total_alerts": 3,
+        "risk_breakdown": {
+            "High": 0,
+            "Medium": 2,
+            "Low": 0,
+            "Informational": 1,
+        },
+        "timestamp": "2025-05-30T16:19:30Z",
+    }
+)
+
+# One synthetic alert per risk level for the filtered-alerts workflow
+_FILTERED_BY_RISK = {
+    risk_level: (
+        ZAPAlert(
+            alert_id="1",
+            name=f"Test {risk_level} Alert",
+            risk=risk_level,
+            confidence="High",
+            url="https://example.com/",
+            description=f"Test {risk_level} description",
+            solution=f"Fix {risk_level} issue",
+            reference="",
+            plugin_id="10001",
+        ),
+    )
+    for risk_level in ("High", "Medium", "Low", "Informational")
+}
+
+# Typical findings for a company presence website
+_COMPANY_FINDINGS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Missing X-Frame-Options Header",
+        risk="Medium",
+        confidence="High",
+        url="https://company.com/",
+        description="X-Frame-Options header is not included",
+        solution="Add X-Frame-Options header",
+        reference="",
+        plugin_id="10001",
+    ),
+    ZAPAlert(
+        alert_id="2",
+        name="Content Security Policy (CSP) Header Not Set",
+        risk="Medium",
+        confidence="High",
+        url="https://company.com/",
+        description="CSP header is missing",
+        solution="Implement Content Security Policy",
+        reference="",
+        plugin_id="10002",
+    ),
+    ZAPAlert(
+        alert_id="3",
+        name="Cookie without SameSite Attribute",
+        risk="Low",
+        confidence="Medium",
+        url="https://company.com/contact",
+        description="Cookie lacks SameSite attribute",
+        solution="Add SameSite attribute to cookies",
+        reference="",
+        plugin_id="10003",
+    ),
+)
+
+# Hardening findings for a production website
+_PRODUCTION_FINDINGS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Strict-Transport-Security Header Not Set",
+        risk="Low",
+        confidence="High",
+        url="https://production.com/",
+        description="HSTS header is missing",
+        solution="Implement HSTS header",
+        reference="",
+        plugin_id="10001",
+    ),
+    ZAPAlert(
+        alert_id="2",
+        name="Server Leaks Information via X-Powered-By Header",
+        risk="Low",
+        confidence="Medium",
+        url="https://production.com/",
+        description="Server reveals technology stack",
+        solution="Remove or modify X-Powered-By header",
+        reference="",
+        plugin_id="10002",
+    ),
+)
 
 
 @pytest.mark.integration
@@ -29,98 +200,16 @@ class TestCompleteWorkflowIntegration:
     """Test complete security scanning workflows."""
 
     @pytest.fixture
-    def mock_zap_client(self):
+    def mock_zap_client(self, zap_client_class, mock_zap_client_factory):
         """Create a comprehensive mock ZAP client."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-
-            # Health check responses
-            mock_client.health_check.return_value = True
-
-            # Session management
-            mock_client.clear_session.return_value = True
-
-            # Scan responses
-            mock_client.spider_scan.return_value = "123"
-            mock_client.active_scan.return_value = "456"
-
-            # Mock alerts
-            from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-            mock_alerts = [
-                ZAPAlert(
-                    alert_id="1",
-                    name="Missing X-Frame-Options Header",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://example.com/",
-                    description="X-Frame-Options header is not included in the response",
-                    solution="Add X-Frame-Options header",
-                    reference="",
-                    plugin_id="10001",
-                ),
-                ZAPAlert(
-                    alert_id="2",
-                    name="Content Security Policy (CSP) Header Not Set",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://example.com/",
-                    description="Content Security Policy header is missing",
-                    solution="Implement Content Security Policy",
-                    reference="",
-                    plugin_id="10002",
-                ),
-                ZAPAlert(
-                    alert_id="3",
-                    name="Information Disclosure - Sensitive Information in URL",
-                    risk="Informational",
-                    confidence="Medium",
-                    url="https://example.com/contact",
-                    description="The response contains sensitive information",
-                    solution="Review information disclosure",
-                    reference="",
-                    plugin_id="10003",
-                ),
-            ]
-            mock_client.get_alerts.return_value = mock_alerts
-
-            # Report generation
-            mock_html_report = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>ZAP Security Report</title></head>
-            <body>
-                <h1>Security Assessment Report</h1>
-                <h2>Target: https://example.com</h2>
-                <h3>Summary</h3>
-                <p>3 issues found</p>
-                <h3>Findings</h3>
-                <ul>
-                    <li>Missing X-Frame-Options Header (Medium)</li>
-                    <li>Content Security Policy Header Not Set (Medium)</li>
-                    <li>Information Disclosure (Informational)</li>
-                </ul>
-            </body>
-            </html>
-            """
-            mock_client.generate_html_report.return_value = mock_html_report
-
-            mock_json_report = {
-                "target": "https://example.com",
-                "alerts": [alert.__dict__ for alert in mock_alerts],
-                "total_alerts": 3,
-                "risk_breakdown": {
-                    "High": 0,
-                    "Medium": 2,
-                    "Low": 0,
-                    "Informational": 1,
-                },
-                "timestamp": "2025-05-30T16:19:30Z",
-            }
-            mock_client.generate_json_report.return_value = json.dumps(mock_json_report)
-
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            yield mock_client
+        # Health check, session and scan IDs ("123"/"456") use factory defaults
+        return zap_client_class.install(
+            mock_zap_client_factory(
+                alerts=list(_WORKFLOW_ALERTS),
+                html_report=_WORKFLOW_HTML_REPORT,
+                json_report=_WORKFLOW_JSON_REPORT,
+            )
+        )
 
     @pytest.mark.asyncio
     async def test_example_com_complete_workflow(self, mock_zap_client):
@@ -129,17 +218,17 @@ class TestCompleteWorkflowIntegration:
 
         # Step 1: Health Check
         health_result = await mcp_zap_health_check()
-        health_data = json.loads(health_result["content"][0]["text"])
+        health_data = _payload(health_result)
         assert health_data["success"] is True
 
         # Step 2: Clear Session
         clear_result = await mcp_zap_clear_session()
-        clear_data = json.loads(clear_result["content"][0]["text"])
+        clear_data = _payload(clear_result)
         assert clear_data["success"] is True
 
         # Step 3: Spider Scan
         spider_result = await mcp_zap_spider_scan(target_url)
-        spider_data = json.loads(spider_result["content"][0]["text"])
+        spider_data = _payload(spider_result)
         assert spider_data["success"] is True
         assert "https://example.com" in spider_data["url"]
 
@@ -148,29 +237,33 @@ class TestCompleteWorkflowIntegration:
 
         # Step 4: Active Scan
         active_result = await mcp_zap_active_scan(target_url)
-        active_data = json.loads(active_result["content"][0]["text"])
+        active_data = _payload(active_result)
         assert active_data["success"] is True
 
+        # Steps 5-8 only read scan results, so they can run together
+        alerts_result, html_result, json_result, summary_result = await asyncio.gather(
+            mcp_zap_get_alerts(),
+            mcp_zap_generate_html_report(),
+            mcp_zap_generate_json_report(),
+            mcp_zap_scan_summary(target_url),
+        )
+
         # Step 5: Get Alerts
-        alerts_result = await mcp_zap_get_alerts()
-        alerts_data = json.loads(alerts_result["content"][0]["text"])
+        alerts_data = _payload(alerts_result)
         assert alerts_data["success"] is True
 
         # Step 6: Generate HTML Report
-        html_result = await mcp_zap_generate_html_report()
         html_content = html_result["content"][0]["text"]
         assert html_content is not None
         assert "<!DOCTYPE html>" in html_content
 
         # Step 7: Generate JSON Report
-        json_result = await mcp_zap_generate_json_report()
         json_content = json_result["content"][0]["text"]
         parsed_json = json.loads(json_content)
         assert isinstance(parsed_json, dict)
 
         # Step 8: Scan Summary
-        summary_result = await mcp_zap_scan_summary(target_url)
-        summary_data = json.loads(summary_result["content"][0]["text"])
+        summary_data = _payload(summary_result)
         assert summary_data["success"] is True
 
     @pytest.mark.asyncio
@@ -178,14 +271,7 @@ class TestCompleteWorkflowIntegration:
         """Test workflow with httpbin.org (another real target)."""
         target_url = "httpbin.org"
 
-        # Run basic workflow
-        health_result = await mcp_zap_health_check()
-        spider_result = await mcp_zap_spider_scan(target_url)
-        alerts_result = await mcp_zap_get_alerts()
-
-        health_data = json.loads(health_result["content"][0]["text"])
-        spider_data = json.loads(spider_result["content"][0]["text"])
-        alerts_data = json.loads(alerts_result["content"][0]["text"])
+        health_data, spider_data, alerts_data = await _basic_workflow(target_url)
 
         assert health_data["success"] is True
         assert spider_data["success"] is True
@@ -195,72 +281,58 @@ class TestCompleteWorkflowIntegration:
         mock_zap_client.spider_scan.assert_called_with("https://httpbin.org", 5)
 
     @pytest.mark.asyncio
-    async def test_localhost_development_workflow(self, mock_zap_client):
-        """Test workflow with localhost development server."""
-        target_urls = [
+    @pytest.mark.parametrize(
+        "target_url, expected_url",
+        [
             ("localhost:3000", "localhost:3000"),  # No dot, not normalized
             ("127.0.0.1:8080", "https://127.0.0.1:8080"),  # Has dot, gets normalized
             ("localhost:8000", "localhost:8000"),  # No dot, not normalized
-        ]
-
-        for target_url, expected_url in target_urls:
-            spider_result = await mcp_zap_spider_scan(target_url)
-            spider_data = json.loads(spider_result["content"][0]["text"])
-            assert spider_data["success"] is True
+        ],
+    )
+    async def test_localhost_development_workflow(
+        self, mock_zap_client, target_url, expected_url
+    ):
+        """Test workflow with localhost development server."""
+        spider_result = await mcp_zap_spider_scan(target_url)
+        spider_data = _payload(spider_result)
+        assert spider_data["success"] is True
 
-            # Verify URL normalization for localhost
-            mock_zap_client.spider_scan.assert_called_with(expected_url, 5)
+        # Verify URL normalization for localhost
+        mock_zap_client.spider_scan.assert_called_once_with(expected_url, 5)
 
     @pytest.mark.asyncio
     async def test_error_recovery_workflow(self, mock_zap_client):
         """Test workflow with error conditions and recovery."""
         # Simulate health check failure initially
-        mock_zap_client.health_check.return_value = False
+        mock_zap_client.health_status = False
 
         health_result = await mcp_zap_health_check()
-        health_data = json.loads(health_result["content"][0]["text"])
+        health_data = _payload(health_result)
         assert health_data["success"] is False
 
         # Recover - health check now passes
-        mock_zap_client.health_check.return_value = True
+        mock_zap_client.health_status = True
 
         health_result = await mcp_zap_health_check()
-        health_data = json.loads(health_result["content"][0]["text"])
+        health_data = _payload(health_result)
         assert health_data["success"] is True
 
         # Continue with scan
         spider_result = await mcp_zap_spider_scan("example.com")
-        spider_data = json.loads(spider_result["content"][0]["text"])
+        spider_data = _payload(spider_result)
         assert spider_data["success"] is True
 
     @pytest.mark.asyncio
     async def test_filtered_alerts_workflow(self, mock_zap_client):
         """Test workflow with filtered security alerts."""
         # Test different risk level filters
-        risk_levels = ["High", "Medium", "Low", "Informational"]
-
-        for risk_level in risk_levels:
+        for filtered_alerts in _FILTERED_BY_RISK.values():
             # Mock filtered response
-            from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-            filtered_alerts = [
-                ZAPAlert(
-                    alert_id="1",
-                    name=f"Test {risk_level} Alert",
-                    risk=risk_level,
-                    confidence="High",
-                    url="https://example.com/",
-                    description=f"Test {risk_level} description",
-                    solution=f"Fix {risk_level} issue",
-                    reference="",
-                    plugin_id="10001",
-                ),
-            ]
-            mock_zap_client.get_alerts.return_value = filtered_alerts
+            mock_zap_client.get_alerts.return_value = list(filtered_alerts)
 
             # Note: mcp_zap_get_alerts doesn't take risk_level parameter in current implementation
             alerts_result = await mcp_zap_get_alerts()
-            alerts_data = json.loads(alerts_result["content"][0]["text"])
+            alerts_data = _payload(alerts_result)
             assert alerts_data["success"] is True
 
     @pytest.mark.asyncio
@@ -270,85 +342,82 @@ class TestCompleteWorkflowIntegration:
         mock_zap_client.get_alerts.return_value = []
 
         alerts_result = await mcp_zap_get_alerts()
-        alerts_data = json.loads(alerts_result["content"][0]["text"])
+        alerts_data = _payload(alerts_result)
         assert alerts_data["success"] is True
 
         # Test scan summary with no alerts
         summary_result = await mcp_zap_scan_summary("clean-site.com")
-        summary_data = json.loads(summary_result["content"][0]["text"])
+        summary_data = _payload(summary_result)
         assert summary_data["success"] is True
 
 
+# Reports served to TestReportGenerationIntegration
+_REPORT_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head><title>Security Report</title></head>
+        <body><h1>OWASP ZAP Report</h1></body>
+        </html>
+        """
+_REPORT_JSON = json.dumps(
+    {
+        "alerts": [
+            {
+                "name": "Test Alert",
+                "risk": "Medium",
+                "confidence": "High",
+                "description": "Test description",
+                "url": "https://example.com/",
+                "solution": "Test solution",
+            }
+        ],
+        "total_alerts": 1,
+        "timestamp": "2025-05-30T16:19:30Z",
+    }
+)
+
+
+@pytest.fixture
+def report_mock_client(zap_client_class, mock_zap_client_factory):
+    """Install a client with both HTML and JSON reports preconfigured."""
+    return zap_client_class.install(
+        mock_zap_client_factory(html_report=_REPORT_HTML, json_report=_REPORT_JSON)
+    )
+
+
 @pytest.mark.integration
 class TestReportGenerationIntegration:
     """Test report generation and file handling."""
 
-    @pytest.fixture
-    def temp_reports_dir(self):
-        """Create a temporary directory for reports."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
     @pytest.mark.asyncio
-    async def test_html_report_content_validation(self):
+    async def test_html_report_content_validation(self, report_mock_client):
         """Test HTML report content is properly formatted."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_html = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Security Report</title></head>
-            <body><h1>OWASP ZAP Report</h1></body>
-            </html>
-            """
-            mock_client.generate_html_report.return_value = mock_html
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            result = await mcp_zap_generate_html_report()
-
-            html_content = result["content"][0]["text"]
-            assert html_content is not None
-            assert "<!DOCTYPE html>" in html_content
-            assert len(html_content) > 100  # Basic content check
+        result = await mcp_zap_generate_html_report()
+
+        html_content = result["content"][0]["text"]
+        assert html_content is not None
+        assert "<!DOCTYPE html>" in html_content
+        assert len(html_content) > 100  # Basic content check
 
     @pytest.mark.asyncio
-    async def test_json_report_structure_validation(self):
+    async def test_json_report_structure_validation(self, report_mock_client):
         """Test JSON report has proper structure."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_json = {
-                "alerts": [
-                    {
-                        "name": "Test Alert",
-                        "risk": "Medium",
-                        "confidence": "High",
-                        "description": "Test description",
-                        "url": "https://example.com/",
-                        "solution": "Test solution",
-                    }
-                ],
-                "total_alerts": 1,
-                "timestamp": "2025-05-30T16:19:30Z",
-            }
-            mock_client.generate_json_report.return_value = json.dumps(mock_json)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        result = await mcp_zap_generate_json_report()
 
-            result = await mcp_zap_generate_json_report()
-
-            json_content = result["content"][0]["text"]
-            parsed_json = json.loads(json_content)
-            assert isinstance(parsed_json, dict)
-            # Validate JSON structure
-            assert "alerts" in parsed_json
-            assert "total_alerts" in parsed_json
-            assert isinstance(parsed_json["alerts"], list)
-            assert isinstance(parsed_json["total_alerts"], int)
+        json_content = result["content"][0]["text"]
+        parsed_json = json.loads(json_content)
+        assert isinstance(parsed_json, dict)
+        # Validate JSON structure
+        assert "alerts" in parsed_json
+        assert "total_alerts" in parsed_json
+        assert isinstance(parsed_json["alerts"], list)
+        assert isinstance(parsed_json["total_alerts"], int)
 
-    def test_report_directory_structure_creation(self, temp_reports_dir):
+    def test_report_directory_structure_creation(self, temp_reports_directory):
         """Test creating proper report directory structure."""
         # Simulate the directory structure we create in scan_example_mcp.py
         timestamp = "20250530_161218"
-        base_dir = temp_reports_dir / "example_com" / timestamp
+        base_dir = temp_reports_directory / "example_com" / timestamp
 
         # Create subdirectories
         (base_dir / "html").mkdir(parents=True, exist_ok=True)
@@ -361,10 +430,10 @@ class TestReportGenerationIntegration:
         assert (base_dir / "json").exists()
         assert (base_dir / "summary").exists()
 
-        # Create sample files
-        (base_dir / "html" / "security_report.html").write_text("<html>Report</html>")
-        (base_dir / "json" / "security_report.json").write_text('{"alerts": []}')
-        (base_dir / "summary" / "executive_summary.md").write_text("# Summary")
+        # Create placeholder files; only the layout is checked
+        (base_dir / "html" / "security_report.html").touch()
+        (base_dir / "json" / "security_report.json").touch()
+        (base_dir / "summary" / "executive_summary.md").touch()
 
         # Verify files
         assert (base_dir / "html" / "security_report.html").exists()
@@ -378,76 +447,37 @@ class TestRealWorldScenarios:
     """Test scenarios based on real-world usage patterns."""
 
     @pytest.mark.asyncio
-    async def test_company_website_assessment(self):
+    async def test_company_website_assessment(self, zap_client_class):
         """Test assessment of a company presence website like example.com."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            # Mock typical company website findings
-            from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-            typical_findings = [
-                ZAPAlert(
-                    alert_id="1",
-                    name="Missing X-Frame-Options Header",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://company.com/",
-                    description="X-Frame-Options header is not included",
-                    solution="Add X-Frame-Options header",
-                    reference="",
-                    plugin_id="10001",
-                ),
-                ZAPAlert(
-                    alert_id="2",
-                    name="Content Security Policy (CSP) Header Not Set",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://company.com/",
-                    description="CSP header is missing",
-                    solution="Implement Content Security Policy",
-                    reference="",
-                    plugin_id="10002",
-                ),
-                ZAPAlert(
-                    alert_id="3",
-                    name="Cookie without SameSite Attribute",
-                    risk="Low",
-                    confidence="Medium",
-                    url="https://company.com/contact",
-                    description="Cookie lacks SameSite attribute",
-                    solution="Add SameSite attribute to cookies",
-                    reference="",
-                    plugin_id="10003",
-                ),
-            ]
-            mock_client.get_alerts.return_value = typical_findings
-            mock_client.health_check.return_value = True
-            mock_client.spider_scan.return_value = "123"
-            mock_client.active_scan.return_value = "456"
-
-            # Run assessment
-            health_result = await mcp_zap_health_check()
-            spider_result = await mcp_zap_spider_scan("company.com")
-            alerts_result = await mcp_zap_get_alerts()
-            summary_result = await mcp_zap_scan_summary("company.com")
+        mock_client = zap_client_class.install()
 
-            # Verify results
-            health_data = json.loads(health_result["content"][0]["text"])
-            spider_data = json.loads(spider_result["content"][0]["text"])
-            alerts_data = json.loads(alerts_result["content"][0]["text"])
-            summary_data = json.loads(summary_result["content"][0]["text"])
+        mock_client.get_alerts.return_value = _COMPANY_FINDINGS
+        mock_client.health_check.return_value = True
+        mock_client.spider_scan.return_value = "123"
+        mock_client.active_scan.return_value = "456"
 
-            assert health_data["success"] is True
-            assert spider_data["success"] is True
-            assert alerts_data["success"] is True
-            assert summary_data["success"] is True
+        # Run assessment; reporting only needs the scan to have started
+        health_result = await mcp_zap_health_check()
+        spider_result = await mcp_zap_spider_scan("company.com")
+        alerts_result, summary_result = await asyncio.gather(
+            mcp_zap_get_alerts(), mcp_zap_scan_summary("company.com")
+        )
+
+        # Verify results
+        health_data = _payload(health_result)
+        spider_data = _payload(spider_result)
+        alerts_data = _payload(alerts_result)
+        summary_data = _payload(summary_result)
+
+        assert health_data["success"] is True
+        assert spider_data["success"] is True
+        assert alerts_data["success"] is True
+        assert summary_data["success"] is True
 
     @pytest.mark.asyncio
-    async def test_api_endpoint_assessment(self):
-        """Test assessment of API endpoints."""
-        api_endpoints = [
+    @pytest.mark.parametrize(
+        "endpoint, expected_url",
+        [
             ("api.example.com", "https://api.example.com"),  # Has dot, gets normalized
             (
                 "api.example.com/v1",
@@ -457,100 +487,72 @@ class TestRealWorldScenarios:
                 "localhost:8080/api",
                 "localhost:8080/api",
             ),  # No dot in domain, not normalized
-        ]
-
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.spider_scan.return_value = "123"
-            mock_client.health_check.return_value = True
+        ],
+    )
+    async def test_api_endpoint_assessment(
+        self, zap_client_class, endpoint, expected_url
+    ):
+        """Test assessment of API endpoints."""
+        mock_client = zap_client_class.install()
+        mock_client.spider_scan.return_value = "123"
+        mock_client.health_check.return_value = True
 
-            for endpoint, expected_url in api_endpoints:
-                spider_result = await mcp_zap_spider_scan(endpoint)
-                spider_data = json.loads(spider_result["content"][0]["text"])
-                assert spider_data["success"] is True
+        spider_result = await mcp_zap_spider_scan(endpoint)
+        spider_data = _payload(spider_result)
+        assert spider_data["success"] is True
 
-                # Verify URL normalization for APIs
-                mock_client.spider_scan.assert_called_with(expected_url, 5)
+        # Verify URL normalization for APIs
+        mock_client.spider_scan.assert_called_once_with(expected_url, 5)
 
     @pytest.mark.asyncio
-    async def test_development_environment_scan(self):
-        """Test scanning development environments."""
-        dev_targets = [
+    @pytest.mark.parametrize(
+        "target, expected_url",
+        [
             ("localhost:3000", "localhost:3000"),  # No dot, not normalized
             ("localhost:8000", "localhost:8000"),  # No dot, not normalized
             ("127.0.0.1:5000", "https://127.0.0.1:5000"),  # Has dot, gets normalized
             ("localhost:4200", "localhost:4200"),  # No dot, not normalized
-        ]
-
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.health_check.return_value = True
-            mock_client.spider_scan.return_value = "123"
-            mock_client.active_scan.return_value = "456"
-
-            for target, expected_url in dev_targets:
-                # Test spider scan
-                spider_result = await mcp_zap_spider_scan(target)
-                spider_data = json.loads(spider_result["content"][0]["text"])
-                assert spider_data["success"] is True
-
-                # Test active scan
-                active_result = await mcp_zap_active_scan(target)
-                active_data = json.loads(active_result["content"][0]["text"])
-                assert active_data["success"] is True
-
-                # Verify URL normalization
-                mock_client.spider_scan.assert_called_with(expected_url, 5)
-                mock_client.active_scan.assert_called_with(expected_url, None)
+        ],
+    )
+    async def test_development_environment_scan(
+        self, zap_client_class, target, expected_url
+    ):
+        """Test scanning development environments."""
+        mock_client = zap_client_class.install()
+        mock_client.health_check.return_value = True
+        mock_client.spider_scan.return_value = "123"
+        mock_client.active_scan.return_value = "456"
+
+        # Test spider scan
+        spider_result = await mcp_zap_spider_scan(target)
+        spider_data = _payload(spider_result)
+        assert spider_data["success"] is True
+
+        # Test active scan
+        active_result = await mcp_zap_active_scan(target)
+        active_data = _payload(active_result)
+        assert active_data["success"] is True
+
+        # Verify URL normalization
+        mock_client.spider_scan.assert_called_once_with(expected_url, 5)
+        mock_client.active_scan.assert_called_once_with(expected_url, None)
 
     @pytest.mark.asyncio
-    async def test_production_security_hardening_check(self):
+    async def test_production_security_hardening_check(self, zap_client_class):
         """Test security hardening checks for production websites."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            # Mock production security findings
-            from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-            production_findings = [
-                ZAPAlert(
-                    alert_id="1",
-                    name="Strict-Transport-Security Header Not Set",
-                    risk="Low",
-                    confidence="High",
-                    url="https://production.com/",
-                    description="HSTS header is missing",
-                    solution="Implement HSTS header",
-                    reference="",
-                    plugin_id="10001",
-                ),
-                ZAPAlert(
-                    alert_id="2",
-                    name="Server Leaks Information via X-Powered-By Header",
-                    risk="Low",
-                    confidence="Medium",
-                    url="https://production.com/",
-                    description="Server reveals technology stack",
-                    solution="Remove or modify X-Powered-By header",
-                    reference="",
-                    plugin_id="10002",
-                ),
-            ]
-
-            mock_client.get_alerts.return_value = production_findings
-            mock_client.health_check.return_value = True
-
-            # Run security check
-            alerts_result = await mcp_zap_get_alerts()
-            alerts_data = json.loads(alerts_result["content"][0]["text"])
-            assert alerts_data["success"] is True
+        mock_client = zap_client_class.install()
 
-            # Verify production-specific findings are captured
-            assert alerts_data["total_alerts"] == 2
-            assert any(
-                "Strict-Transport-Security" in alert["name"]
-                for alert in alerts_data["alerts"]
-            )
+        mock_client.get_alerts.return_value = _PRODUCTION_FINDINGS
+        mock_client.health_check.return_value = True
+
+        # Run security check
+        alerts_result = await mcp_zap_get_alerts()
+        alerts_data = _payload(alerts_result)
+        assert alerts_data["success"] is True
+
+        # Verify production-specific findings are captured
+        assert alerts_data["total_alerts"] == 2
+        assert any(
+            "Strict-Transport-Security" in alert["name"]
+            for alert in alerts_data["alerts"]
+        )
@@ -6,207 +6,215 @@ the "Invalid session ID" error from recurring.
 """
 
 import asyncio
+import functools
 import json
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
+import pytest_asyncio
 
 
-@pytest.mark.integration
-@pytest.mark.mcp
-class TestMCPInterfaceRegression:
-    """Regression tests for MCP interface functionality"""
+def _tools_call(name, arguments=None, request_id=1):
+    """Encode a JSON-RPC ``tools/call`` request body."""
+    payload = {
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments or {}},
+        "jsonrpc": "2.0",
+        "id": request_id,
+    }
+    return json.dumps(payload).encode()
 
-    @pytest.fixture
-    def mcp_base_url(self):
-        """Base URL for MCP server"""
-        return "http://localhost:3000"
 
-    @pytest.fixture
-    def test_session_id(self):
-        """Test session ID"""
-        return "test_regression_session"
+# Request bodies are fixed, so they are encoded once per module
+_HEALTH_CHECK_BODY = _tools_call("zap_health_check")
+_SPIDER_SCAN_BODY = _tools_call(
+    "zap_spider_scan", {"random_string": "https://example.com"}, request_id=2
+)
+_GET_ALERTS_BODY = _tools_call("zap_get_alerts", request_id=2)
+_INVALID_TOOL_BODY = _tools_call("invalid_tool_name")
 
-    @pytest.mark.asyncio
-    async def test_mcp_session_auto_creation(self, mcp_base_url, test_session_id):
-        """Test that MCP interface auto-creates sessions correctly"""
-        url = f"{mcp_base_url}/mcp/messages"
-        params = {"session_id": test_session_id}
-
-        payload = {
-            "method": "tools/call",
-            "params": {"name": "zap_health_check", "arguments": {}},
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                params=params,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                # Should not return "Invalid session ID" error
-                assert response.status == 200
 
-                result = await response.json()
+def _is_session_error(result):
+    """Whether a /mcp/messages reply is the session validation error.
 
-                # Should return success status, not error
-                assert result.get("status") == "success"
-                assert "Invalid session ID" not in str(result)
+    The handler reports failures in the HTTP body either as a flat
+    ``{"error": "..."}`` or as a JSON-RPC error object, so only
+    ``result["error"]`` and ``result["error"]["message"]`` are checked.
+    """
+    error = result.get("error")
+    if isinstance(error, dict):
+        error = error.get("message")
+    return "Invalid session ID" in str(error or "")
 
-    @pytest.mark.asyncio
-    async def test_mcp_parameter_processing(self, mcp_base_url, test_session_id):
-        """Test that parameter processing works correctly with random_string"""
-        url = f"{mcp_base_url}/mcp/messages"
-        params = {"session_id": f"{test_session_id}_params"}
-
-        payload = {
-            "method": "tools/call",
-            "params": {
-                "name": "zap_spider_scan",
-                "arguments": {"random_string": "https://example.com"},
-            },
-            "jsonrpc": "2.0",
-            "id": 2,
-        }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                params=params,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                # Should successfully process the URL from random_string
-                assert response.status == 200
+_DEV_TIPS_PATH = Path(__file__).parents[2] / "docs" / "development-tips.ai.md"
 
-                result = await response.json()
-                assert result.get("status") == "success"
+
+@functools.cache
+def _dev_tips_text():
+    """Return the development tips document, or None if it is not present."""
+    try:
+        return _DEV_TIPS_PATH.read_text()
+    except FileNotFoundError:
+        return None
+
+
+@pytest.fixture(scope="session")
+def mcp_base_url():
+    """Base URL for MCP server"""
+    return "http://localhost:3000"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_session(mcp_base_url):
+    """One aiohttp session, and its keep-alive pool, shared by every test."""
+    # Every request goes to one local host, so resolve it once per run
+    connector = aiohttp.TCPConnector(
+        limit=100, keepalive_timeout=30, ttl_dns_cache=None
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Open a pooled connection up front so the first test is not the
+        # one paying for DNS and the TCP handshake
+        try:
+            async with session.get(
+                f"{mcp_base_url}/health", timeout=aiohttp.ClientTimeout(total=2)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        yield session
+
+
+@pytest.fixture(scope="module")
+def messages_url(mcp_base_url):
+    """MCP message endpoint, built once per module"""
+    return f"{mcp_base_url}/mcp/messages"
+
+
+@pytest.fixture(scope="module")
+def test_session_id():
+    """Test session ID"""
+    return "test_regression_session"
+
+
+@pytest.mark.integration
+@pytest.mark.mcp
+class TestMCPInterfaceRegression:
+    """Regression tests for MCP interface functionality"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "session_suffix, body",
+        [
+            # Session is auto-created on the first call
+            pytest.param("", _HEALTH_CHECK_BODY, id="session_auto_creation"),
+            # URL is taken from random_string during parameter processing
+            pytest.param("_params", _SPIDER_SCAN_BODY, id="parameter_processing"),
+        ],
+    )
+    async def test_mcp_tool_call(
+        self, http_session, messages_url, test_session_id, session_suffix, body
+    ):
+        """Test that single tool calls succeed without session errors"""
+        params = {"session_id": f"{test_session_id}{session_suffix}"}
+
+        async with http_session.post(
+            messages_url,
+            params=params,
+            data=body,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            # Should not return "Invalid session ID" error
+            assert response.status == 200
+
+            result = await response.json()
+
+            # Should return success status, not error
+            assert result.get("status") == "success"
+            assert not _is_session_error(result)
 
     @pytest.mark.asyncio
-    async def test_mcp_multiple_tool_calls(self, mcp_base_url, test_session_id):
+    async def test_mcp_multiple_tool_calls(
+        self, http_session, messages_url, test_session_id
+    ):
         """Test multiple tool calls in the same session"""
-        url = f"{mcp_base_url}/mcp/messages"
         params = {"session_id": f"{test_session_id}_multi"}
 
         # First call - health check
-        payload1 = {
-            "method": "tools/call",
-            "params": {"name": "zap_health_check", "arguments": {}},
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-
-        # Second call - get alerts
-        payload2 = {
-            "method": "tools/call",
-            "params": {"name": "zap_get_alerts", "arguments": {}},
-            "jsonrpc": "2.0",
-            "id": 2,
-        }
-
-        async with aiohttp.ClientSession() as session:
-            # First call
-            async with session.post(
-                url,
-                params=params,
-                json=payload1,
-                headers={"Content-Type": "application/json"},
-            ) as response1:
-                assert response1.status == 200
-                result1 = await response1.json()
-                assert result1.get("status") == "success"
-
-            # Second call in same session
-            async with session.post(
-                url,
-                params=params,
-                json=payload2,
-                headers={"Content-Type": "application/json"},
-            ) as response2:
-                assert response2.status == 200
-                result2 = await response2.json()
-                assert result2.get("status") == "success"
+        async with http_session.post(
+            messages_url,
+            params=params,
+            data=_HEALTH_CHECK_BODY,
+            headers={"Content-Type": "application/json"},
+        ) as response1:
+            assert response1.status == 200
+            result1 = await response1.json()
+            assert result1.get("status") == "success"
+
+        # Second call in same session - get alerts
+        async with http_session.post(
+            messages_url,
+            params=params,
+            data=_GET_ALERTS_BODY,
+            headers={"Content-Type": "application/json"},
+        ) as response2:
+            assert response2.status == 200
+            result2 = await response2.json()
+            assert result2.get("status") == "success"
 
     @pytest.mark.asyncio
-    async def test_mcp_error_handling(self, mcp_base_url):
+    async def test_mcp_error_handling(self, http_session, messages_url):
         """Test MCP error handling doesn't return generic session errors"""
-        url = f"{mcp_base_url}/mcp/messages"
         params = {"session_id": "error_test_session"}
 
         # Invalid tool name
-        payload = {
-            "method": "tools/call",
-            "params": {"name": "invalid_tool_name", "arguments": {}},
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                params=params,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                # Should return proper error, not session validation error
-                assert response.status == 200  # MCP returns 200 with error in body
-
-                result = await response.json()
-                # Should not be a session error
-                assert "Invalid session ID" not in str(result)
+        async with http_session.post(
+            messages_url,
+            params=params,
+            data=_INVALID_TOOL_BODY,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            # Should return proper error, not session validation error
+            assert response.status == 200  # MCP returns 200 with error in body
+
+            result = await response.json()
+            # Should not be a session error
+            assert not _is_session_error(result)
 
     @pytest.mark.asyncio
-    async def test_mcp_missing_session_id(self, mcp_base_url):
+    async def test_mcp_missing_session_id(self, http_session, messages_url):
         """Test proper error when session_id is missing"""
-        url = f"{mcp_base_url}/mcp/messages"
         # No session_id parameter
+        async with http_session.post(
+            messages_url,
+            data=_HEALTH_CHECK_BODY,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            # Should return 400 with proper error message
+            assert response.status == 400
 
-        payload = {
-            "method": "tools/call",
-            "params": {"name": "zap_health_check", "arguments": {}},
-            "jsonrpc": "2.0",
-            "id": 1,
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, headers={"Content-Type": "application/json"}
-            ) as response:
-                # Should return 400 with proper error message
-                assert response.status == 400
-
-                result = await response.json()
-                assert result.get("error") == "Missing session_id parameter"
+            result = await response.json()
+            assert result.get("error") == "Missing session_id parameter"
 
     def test_mcp_interface_documentation(self):
         """Test that MCP interface is properly documented"""
         # Ensure the development tips mention the MCP interface patterns
-        import os
-
-        docs_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "docs", "development-tips.ai.md"
-        )
-
-        if os.path.exists(docs_path):
-            with open(docs_path, "r") as f:
-                content = f.read()
-
-            # Check for key MCP documentation
-            assert "random_string" in content
-            assert "parameter processing" in content.lower()
-            assert "mcp" in content.lower()
-        else:
+        content = _dev_tips_text()
+        if content is None:
             pytest.skip("Development tips documentation not found")
 
+        # Check for key MCP documentation
+        lowered = content.lower()
+        assert "random_string" in content
+        assert "parameter processing" in lowered
+        assert "mcp" in lowered
+
     @pytest.mark.asyncio
-    async def test_mcp_real_world_workflow(self, mcp_base_url):
+    async def test_mcp_real_world_workflow(self, http_session, messages_url):
         """Test a real-world MCP workflow similar to example.com scan"""
         session_id = "real_world_test"
-        url = f"{mcp_base_url}/mcp/messages"
         params = {"session_id": session_id}
 
         # Simulate the workflow we used for example.com
@@ -228,25 +236,26 @@ class TestMCPInterfaceRegression:
             },
         ]
 
-        async with aiohttp.ClientSession() as session:
-            for i, step in enumerate(workflow_steps, 1):
-                payload = {
-                    "method": "tools/call",
-                    "params": step,
-                    "jsonrpc": "2.0",
-                    "id": i,
-                }
-
-                async with session.post(
-                    url,
-                    params=params,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    assert response.status == 200, f"Step {step['description']} failed"
-
-                    result = await response.json()
-                    assert (
-                        result.get("status") == "success"
-                    ), f"Step {step['description']} returned error: {result}"
-                    assert "Invalid session ID" not in str(result)
+        # The health check gates the scan, and alerts need the spider to have
+        # been launched, so each step is sent and checked before the next
+        for i, step in enumerate(workflow_steps, 1):
+            payload = {
+                "method": "tools/call",
+                "params": step,
+                "jsonrpc": "2.0",
+                "id": i,
+            }
+
+            async with http_session.post(
+                messages_url,
+                params=params,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                assert response.status == 200, f"Step {step['description']} failed"
+
+                result = await response.json()
+                assert (
+                    result.get("status") == "success"
+                ), f"Step {step['description']} returned error: {result}"
+                assert not _is_session_error(result)
@@ -4,9 +4,9 @@ Tests for MCP ZAP Tools
 Tests covering the MCP tool functions with URL normalization and parameter processing.
 """
 
-import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import asdict, replace
+from itertools import cycle, islice
 
 import pytest
 
@@ -23,111 +23,219 @@ from src.owasp_zap_mcp.tools.zap_tools import (
     mcp_zap_spider_status,
     normalize_url,
 )
+from src.owasp_zap_mcp.zap_client import ZAPAlert, ZAPScanStatus
+
+
+def _payload(result):
+    """Decode the JSON body of an MCP tool result."""
+    return json.loads(result["content"][0]["text"])
+
+
+# (input, expected) pairs covering normalize_url's contract
+URL_NORMALIZATION_CASES = (
+    # Plain domains, subdomains, paths and ports get https://
+    ("example.com", "https://example.com"),
+    ("api.example.com", "https://api.example.com"),
+    ("example.com/api/v1", "https://example.com/api/v1"),
+    ("example.com:8080", "https://example.com:8080"),
+    ("subdomain.example.com/path", "https://subdomain.example.com/path"),
+    # Existing schemes are preserved
+    ("https://already-https.com", "https://already-https.com"),
+    ("http://keep-http.com", "http://keep-http.com"),
+    # Empty input is passed through
+    ("", ""),
+    (None, None),
+    # Real-world examples and patterns discovered during MCP tool usage
+    ("httpbin.org", "https://httpbin.org"),
+    ("httpbin.org/get", "https://httpbin.org/get"),
+    ("google.com", "https://google.com"),
+    ("api.github.com", "https://api.github.com"),
+    ("company.com", "https://company.com"),
+    ("api.service.com/v1", "https://api.service.com/v1"),
+    ("jsonplaceholder.typicode.com", "https://jsonplaceholder.typicode.com"),
+    # Hosts without a dot are left alone; IP addresses contain dots
+    ("localhost:3000", "localhost:3000"),
+    ("127.0.0.1:8080", "https://127.0.0.1:8080"),
+    ("192.168.1.100:9000", "https://192.168.1.100:9000"),
+)
+
+
+# Realistic security findings discovered during actual example.com scans
+_EXAMPLE_COM_ALERTS = (
+    ZAPAlert(
+        alert_id="1",
+        name="Missing X-Frame-Options Header",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="X-Frame-Options header is not included in the response",
+        solution="Add X-Frame-Options header",
+        reference="",
+        plugin_id="10001",
+    ),
+    ZAPAlert(
+        alert_id="2",
+        name="Content Security Policy (CSP) Header Not Set",
+        risk="Medium",
+        confidence="High",
+        url="https://example.com/",
+        description="Content Security Policy header is missing",
+        solution="Implement Content Security Policy",
+        reference="",
+        plugin_id="10002",
+    ),
+    ZAPAlert(
+        alert_id="3",
+        name="Information Disclosure - Sensitive Information in URL",
+        risk="Informational",
+        confidence="Medium",
+        url="https://example.com/contact",
+        description="The response contains sensitive information",
+        solution="Review information disclosure",
+        reference="",
+        plugin_id="10003",
+    ),
+)
+
+_SQL_INJECTION_ALERT = ZAPAlert(
+    alert_id="4",
+    name="SQL Injection",
+    risk="High",
+    confidence="High",
+    url="https://example.com/login",
+    description="SQL injection vulnerability",
+    solution="Use parameterized queries",
+    reference="",
+    plugin_id="10004",
+)
+
+_SUMMARY_ALERT = ZAPAlert(
+    alert_id="5",
+    name="Test Alert",
+    risk="Medium",
+    confidence="High",
+    description="Test description",
+    url="https://example.com/test",
+    solution="Test solution",
+    reference="",
+    plugin_id="10005",
+)
+
+# Distinct findings from an actual httpbin.org scan
+_HTTPBIN_FINDINGS = (
+    ZAPAlert(
+        alert_id="6",
+        name="Server Leaks Version Information via 'Server' HTTP Response Header Field",
+        risk="Low",
+        confidence="High",
+        description="The web/application server is leaking version information",
+        url="https://httpbin.org/",
+        solution="Configure server to not return version information",
+        reference="",
+        plugin_id="10006",
+    ),
+    ZAPAlert(
+        alert_id="7",
+        name="Strict-Transport-Security Header Not Set",
+        risk="Low",
+        confidence="High",
+        description="HTTP Strict Transport Security (HSTS) header not set",
+        url="https://httpbin.org/",
+        solution="Implement HSTS header",
+        reference="",
+        plugin_id="10007",
+    ),
+    ZAPAlert(
+        alert_id="8",
+        name="Content Security Policy (CSP) Header Not Set",
+        risk="Medium",
+        confidence="High",
+        description="Content Security Policy header is missing",
+        url="https://httpbin.org/get",
+        solution="Implement Content Security Policy",
+        reference="",
+        plugin_id="10008",
+    ),
+)
+
+# The full httpbin.org scan reported 140 findings; repeat the distinct ones
+# with fresh IDs so get_alerts sees a realistic volume.
+_HTTPBIN_ALERTS = tuple(
+    replace(finding, alert_id=str(6 + i), plugin_id=str(10006 + i))
+    for i, finding in enumerate(islice(cycle(_HTTPBIN_FINDINGS), 140))
+)
+
+
+# Minimal report payloads returned by the stub client
+_MOCK_HTML = "<!DOCTYPE html>\n<html><body>Security Report</body></html>"
+_MOCK_JSON_STR = json.dumps({"alerts": [], "total_alerts": 0})
+
+# HTML report for the realistic example.com workflow
+_REALISTIC_HTML_REPORT = """
+<!DOCTYPE html>
+<html>
+<head><title>ZAP Security Report - example.com</title></head>
+<body>
+    <h1>Security Assessment Report</h1>
+    <h2>Target: https://example.com</h2>
+    <h3>Summary</h3>
+    <p>3 issues found: 2 Medium, 1 Informational</p>
+    <h3>Findings</h3>
+    <ul>
+        <li>Missing X-Frame-Options Header (Medium)</li>
+        <li>Content Security Policy Header Not Set (Medium)</li>
+        <li>Information Disclosure (Informational)</li>
+    </ul>
+</body>
+</html>
+"""
+
+# Serialized JSON report matching _EXAMPLE_COM_ALERTS
+_REALISTIC_JSON_REPORT = json.dumps(
+    {
+        "target": "https://example.com",
+        "alerts": [asdict(alert) for alert in _EXAMPLE_COM_ALERTS],
+        "total_alerts": 3,
+        "risk_breakdown": {
+            "High": 0,
+            "Medium": 2,
+            "Low": 0,
+            "Informational": 1,
+        },
+        "scan_duration_minutes": 7,
+        "timestamp": "2025-05-30T16:19:30Z",
+    }
+)
 
 
 class TestURLNormalization:
     """Test cases for URL normalization functionality."""
 
-    def test_normalize_url_plain_domain(self):
-        """Test normalizing a plain domain name."""
-        result = normalize_url("example.com")
-        assert result == "https://example.com"
-
-    def test_normalize_url_subdomain(self):
-        """Test normalizing a subdomain."""
-        result = normalize_url("api.example.com")
-        assert result == "https://api.example.com"
-
-    def test_normalize_url_with_path(self):
-        """Test normalizing a domain with path."""
-        result = normalize_url("example.com/api/v1")
-        assert result == "https://example.com/api/v1"
-
-    def test_normalize_url_already_https(self):
-        """Test that HTTPS URLs remain unchanged."""
-        url = "https://example.com"
-        result = normalize_url(url)
-        assert result == url
-
-    def test_normalize_url_http_preserved(self):
-        """Test that HTTP URLs are preserved."""
-        url = "http://example.com"
-        result = normalize_url(url)
-        assert result == url
-
-    def test_normalize_url_with_port(self):
-        """Test normalizing domain with port."""
-        result = normalize_url("example.com:8080")
-        assert result == "https://example.com:8080"
-
-    def test_normalize_url_empty_string(self):
-        """Test normalizing empty string."""
-        result = normalize_url("")
-        assert result == ""
-
-    def test_normalize_url_none(self):
-        """Test normalizing None."""
-        result = normalize_url(None)
-        assert result is None  # Function returns None for None input
-
-    def test_normalize_url_real_examples(self):
-        """Test normalizing real-world examples."""
-        test_cases = [
-            ("httpbin.org", "https://httpbin.org"),
-            ("google.com", "https://google.com"),
-            ("api.github.com", "https://api.github.com"),
-            ("example.com/api/v1", "https://example.com/api/v1"),
-            ("subdomain.example.com/path", "https://subdomain.example.com/path"),
-            # IP addresses and localhost with ports DO get normalized (they contain dots)
-            ("localhost:3000", "localhost:3000"),  # No dot, so not normalized
-            ("127.0.0.1:8080", "https://127.0.0.1:8080"),  # Has dot, gets normalized
-        ]
-
-        for input_url, expected in test_cases:
-            result = normalize_url(input_url)
-            assert (
-                result == expected
-            ), f"Failed for {input_url}: got {result}, expected {expected}"
-
-    def test_normalize_url_discovered_patterns(self):
-        """Test URL normalization patterns discovered during actual usage."""
-        # These are patterns discovered during real MCP tool usage
-        discovered_patterns = [
-            # Company websites
-            ("company.com", "https://company.com"),
-            # API endpoints
-            ("api.example.com", "https://api.example.com"),
-            ("api.service.com/v1", "https://api.service.com/v1"),
-            # Testing services
-            ("httpbin.org", "https://httpbin.org"),
-            ("httpbin.org/get", "https://httpbin.org/get"),
-            ("jsonplaceholder.typicode.com", "https://jsonplaceholder.typicode.com"),
-            # IP addresses get normalized (they contain dots)
-            ("localhost:3000", "localhost:3000"),  # No dot, not normalized
-            ("127.0.0.1:8080", "https://127.0.0.1:8080"),  # Has dot, gets normalized
-            (
-                "192.168.1.100:9000",
-                "https://192.168.1.100:9000",
-            ),  # Has dot, gets normalized
-        ]
-
-        for input_url, expected in discovered_patterns:
-            result = normalize_url(input_url)
-            assert (
-                result == expected
-            ), f"Real-world pattern failed for {input_url}: got {result}, expected {expected}"
+    @pytest.mark.parametrize("raw, expected", URL_NORMALIZATION_CASES)
+    def test_normalize_url_cases(self, raw, expected):
+        """Test normalize_url against the shared case table."""
+        assert normalize_url(raw) == expected
+
+    @pytest.mark.parametrize(
+        "url", ["https://example.com", "http://example.com", "localhost:3000"]
+    )
+    def test_normalize_url_returns_input_unchanged(self, url):
+        """Test URLs needing no change come back without a new string."""
+        assert normalize_url(url) is url
 
 
 class TestMCPZAPTools:
     """Test cases for MCP ZAP tool functions."""
 
     @pytest.fixture
-    def mock_zap_client(self):
-        """Create a mock ZAP client."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            yield mock_client
+    def mock_zap_client(self, zap_client_class):
+        """Install a fresh mock ZAP client behind the module-wide patch."""
+        return zap_client_class.install()
+
+    @pytest.fixture
+    def stub_zap_client(self, zap_client_class, mock_zap_client_factory):
+        """Install a stub client for tests that only need return values."""
+        return zap_client_class.install(mock_zap_client_factory())
 
     @pytest.mark.asyncio
     async def test_mcp_zap_health_check_success(self, mock_zap_client):
@@ -137,18 +245,18 @@ class TestMCPZAPTools:
         result = await mcp_zap_health_check()
 
         assert result["content"][0]["text"]
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
         mock_zap_client.health_check.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_health_check_failure(self, mock_zap_client):
+    async def test_mcp_zap_health_check_failure(self, stub_zap_client):
         """Test MCP health check failure."""
-        mock_zap_client.health_check.return_value = False
+        stub_zap_client.health_status = False
 
         result = await mcp_zap_health_check()
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is False
 
     @pytest.mark.asyncio
@@ -159,7 +267,7 @@ class TestMCPZAPTools:
         # Test with plain domain
         result = await mcp_zap_spider_scan("example.com")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
         assert "https://example.com" in response_data["url"]
         mock_zap_client.spider_scan.assert_called_with("https://example.com", 5)
@@ -171,7 +279,7 @@ class TestMCPZAPTools:
 
         result = await mcp_zap_spider_scan("https://example.com", max_depth=3)
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
         mock_zap_client.spider_scan.assert_called_with("https://example.com", 3)
 
@@ -182,21 +290,19 @@ class TestMCPZAPTools:
 
         result = await mcp_zap_active_scan("example.com")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
         mock_zap_client.active_scan.assert_called_with("https://example.com", None)
 
     @pytest.mark.asyncio
     async def test_mcp_zap_spider_status(self, mock_zap_client):
         """Test spider scan status check."""
-        from src.owasp_zap_mcp.zap_client import ZAPScanStatus
-
         mock_status = ZAPScanStatus.RUNNING
         mock_zap_client.get_spider_status.return_value = mock_status
 
         result = await mcp_zap_spider_status("123")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         # Should fail gracefully when ZAPScanStatus is returned instead of a status object
         assert response_data["success"] is False  # This is expected for now
         mock_zap_client.get_spider_status.assert_called_with("123")
@@ -204,216 +310,83 @@ class TestMCPZAPTools:
     @pytest.mark.asyncio
     async def test_mcp_zap_active_scan_status(self, mock_zap_client):
         """Test active scan status check."""
-        from src.owasp_zap_mcp.zap_client import ZAPScanStatus
-
         mock_status = ZAPScanStatus.COMPLETED
         mock_zap_client.get_active_scan_status.return_value = mock_status
 
         result = await mcp_zap_active_scan_status("456")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         # Should fail gracefully when ZAPScanStatus is returned instead of a status object
         assert response_data["success"] is False  # This is expected for now
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_get_alerts(self, mock_zap_client):
+    async def test_mcp_zap_get_alerts(self, stub_zap_client):
         """Test getting security alerts."""
-        from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-        # Use realistic security findings discovered during actual scans
-        mock_alerts = [
-            ZAPAlert(
-                alert_id="1",
-                name="Missing X-Frame-Options Header",
-                risk="Medium",
-                confidence="High",
-                url="https://example.com/",
-                description="X-Frame-Options header is not included in the response",
-                solution="Add X-Frame-Options header",
-                reference="",
-                plugin_id="10001",
-            ),
-            ZAPAlert(
-                alert_id="2",
-                name="Content Security Policy (CSP) Header Not Set",
-                risk="Medium",
-                confidence="High",
-                url="https://example.com/",
-                description="Content Security Policy header is missing",
-                solution="Implement Content Security Policy",
-                reference="",
-                plugin_id="10002",
-            ),
-            ZAPAlert(
-                alert_id="3",
-                name="Information Disclosure - Sensitive Information in URL",
-                risk="Informational",
-                confidence="Medium",
-                url="https://example.com/contact",
-                description="The response contains sensitive information",
-                solution="Review information disclosure",
-                reference="",
-                plugin_id="10003",
-            ),
-        ]
-        mock_zap_client.get_alerts.return_value = mock_alerts
+        stub_zap_client.get_alerts.return_value = list(_EXAMPLE_COM_ALERTS)
 
         result = await mcp_zap_get_alerts()
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
 
     @pytest.mark.asyncio
     async def test_mcp_zap_get_alerts_with_risk_filter(self, mock_zap_client):
         """Test getting security alerts with risk level filter."""
-        from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-        mock_alerts = [
-            ZAPAlert(
-                alert_id="4",
-                name="SQL Injection",
-                risk="High",
-                confidence="High",
-                url="https://example.com/login",
-                description="SQL injection vulnerability",
-                solution="Use parameterized queries",
-                reference="",
-                plugin_id="10004",
-            ),
-        ]
-        mock_zap_client.get_alerts.return_value = mock_alerts
+        mock_zap_client.get_alerts.return_value = [_SQL_INJECTION_ALERT]
 
         result = await mcp_zap_get_alerts(risk_level="High")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
         mock_zap_client.get_alerts.assert_called_with("High")
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_generate_html_report(self, mock_zap_client):
-        """Test generating HTML report."""
-        mock_html = "<!DOCTYPE html>\n<html><body>Security Report</body></html>"
-        mock_zap_client.generate_html_report.return_value = mock_html
-
-        result = await mcp_zap_generate_html_report()
-        html_content = result["content"][0]["text"] if "content" in result else None
-        assert html_content is not None
-        assert html_content.strip().startswith("<!DOCTYPE html>")
-
-    @pytest.mark.asyncio
-    async def test_mcp_zap_generate_json_report(self, mock_zap_client):
-        """Test generating JSON report."""
-        mock_json = {"alerts": [], "total_alerts": 0}
-        import json as _json
-
-        mock_zap_client.generate_json_report.return_value = _json.dumps(mock_json)
-
-        result = await mcp_zap_generate_json_report()
-        json_content = result["content"][0]["text"] if "content" in result else None
-        assert json_content is not None
-        parsed = _json.loads(json_content)
-        assert isinstance(parsed, dict)
-
-    @pytest.mark.asyncio
-    async def test_mcp_zap_clear_session(self, mock_zap_client):
+    async def test_mcp_zap_clear_session(self, stub_zap_client):
         """Test clearing ZAP session."""
-        mock_zap_client.clear_session.return_value = True
-
         result = await mcp_zap_clear_session()
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_scan_summary(self, mock_zap_client):
+    async def test_mcp_zap_scan_summary(self, stub_zap_client):
         """Test getting scan summary with URL normalization."""
-        from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-        mock_alerts = [
-            ZAPAlert(
-                alert_id="5",
-                name="Test Alert",
-                risk="Medium",
-                confidence="High",
-                description="Test description",
-                url="https://example.com/test",
-                solution="Test solution",
-                reference="",
-                plugin_id="10005",
-            )
-        ]
-        mock_zap_client.get_alerts.return_value = mock_alerts
+        stub_zap_client.get_alerts.return_value = [_SUMMARY_ALERT]
 
         result = await mcp_zap_scan_summary("example.com")
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
 
     @pytest.mark.asyncio
-    async def test_error_handling(self, mock_zap_client):
+    async def test_error_handling(self, stub_zap_client):
         """Test error handling in MCP tools."""
-        mock_zap_client.health_check.side_effect = Exception("Connection error")
+        stub_zap_client.health_status = Exception("Connection error")
 
         result = await mcp_zap_health_check()
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is False
         assert "Connection error" in response_data["error"]
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_get_alerts_realistic_httpbin_findings(self, mock_zap_client):
+    async def test_mcp_zap_get_alerts_realistic_httpbin_findings(self, stub_zap_client):
         """Test getting alerts with realistic httpbin.org findings."""
-        from src.owasp_zap_mcp.zap_client import ZAPAlert
-
-        # Based on actual httpbin.org scan results (140 total findings)
-        mock_alerts = [
-            ZAPAlert(
-                alert_id="6",
-                name="Server Leaks Version Information via 'Server' HTTP Response Header Field",
-                risk="Low",
-                confidence="High",
-                description="The web/application server is leaking version information",
-                url="https://httpbin.org/",
-                solution="Configure server to not return version information",
-                reference="",
-                plugin_id="10006",
-            ),
-            ZAPAlert(
-                alert_id="7",
-                name="Strict-Transport-Security Header Not Set",
-                risk="Low",
-                confidence="High",
-                description="HTTP Strict Transport Security (HSTS) header not set",
-                url="https://httpbin.org/",
-                solution="Implement HSTS header",
-                reference="",
-                plugin_id="10007",
-            ),
-            ZAPAlert(
-                alert_id="8",
-                name="Content Security Policy (CSP) Header Not Set",
-                risk="Medium",
-                confidence="High",
-                description="Content Security Policy header is missing",
-                url="https://httpbin.org/get",
-                solution="Implement Content Security Policy",
-                reference="",
-                plugin_id="10008",
-            ),
-        ]
-        mock_zap_client.get_alerts.return_value = mock_alerts
+        stub_zap_client.get_alerts.return_value = list(_HTTPBIN_ALERTS)
 
         result = await mcp_zap_get_alerts()
 
-        response_data = json.loads(result["content"][0]["text"])
+        response_data = _payload(result)
         assert response_data["success"] is True
+        assert response_data["total_alerts"] == 140
+        assert response_data["displayed_alerts"] == 10
+        assert "showing first 10" in response_data["message"]
 
     @pytest.mark.asyncio
-    async def test_mcp_zap_generate_reports_are_pure_and_valid(self, mock_zap_client):
+    async def test_mcp_zap_generate_reports_are_pure_and_valid(self, stub_zap_client):
         """Test that MCP report tools produce pure, valid HTML and JSON output."""
         # HTML report
-        mock_html = "<!DOCTYPE html>\n<html><body>Security Report</body></html>"
-        mock_zap_client.generate_html_report.return_value = mock_html
+        stub_zap_client.html_report = _MOCK_HTML
         html_result = await mcp_zap_generate_html_report()
         html_content = (
             html_result["content"][0]["text"] if "content" in html_result else None
@@ -421,244 +394,83 @@ class TestMCPZAPTools:
         assert html_content is not None
         assert html_content.strip().startswith("<!DOCTYPE html>")
 
-        # JSON report
-        mock_json = {"alerts": [], "total_alerts": 0}
-        mock_zap_client.generate_json_report.return_value = json.dumps(mock_json)
-        # Patch the tool to return the raw JSON string as it would in the real system
-        with patch(
-            "src.owasp_zap_mcp.tools.zap_tools.ZAPClient.generate_json_report",
-            new=AsyncMock(return_value=json.dumps(mock_json)),
-        ):
-            json_result = await mcp_zap_generate_json_report()
-            json_content = (
-                json_result["content"][0]["text"] if "content" in json_result else None
-            )
-            assert json_content is not None
-            parsed = json.loads(json_content)
-            assert isinstance(parsed, dict)
+        # JSON report, returned as the raw JSON string the real client produces
+        stub_zap_client.json_report = _MOCK_JSON_STR
+        json_result = await mcp_zap_generate_json_report()
+        json_content = (
+            json_result["content"][0]["text"] if "content" in json_result else None
+        )
+        assert json_content is not None
+        parsed = json.loads(json_content)
+        assert isinstance(parsed, dict)
 
 
 @pytest.mark.integration
 class TestMCPToolsIntegration:
     """Integration tests for MCP tools with realistic scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_complete_scan_workflow(self):
-        """Test a complete scan workflow using MCP tools."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            # Mock successful responses
-            mock_client.health_check.return_value = True
-            mock_client.clear_session.return_value = True
-            mock_client.spider_scan.return_value = "123"
-            mock_client.active_scan.return_value = "456"
-            mock_client.get_alerts.return_value = []
-            mock_client.generate_html_report.return_value = (
-                "<!DOCTYPE html>\n<html>Report</html>"
-            )
-            import json as _json
-
-            mock_client.generate_json_report.return_value = _json.dumps(
-                {
-                    "alerts": [],
-                    "total_alerts": 0,
-                }
+    @pytest.fixture
+    def workflow_client(self, zap_client_class, mock_zap_client_factory):
+        """Install a client preloaded with realistic example.com results."""
+        # Health check, session and scan IDs ("123"/"456") use factory defaults
+        return zap_client_class.install(
+            mock_zap_client_factory(
+                alerts=list(_EXAMPLE_COM_ALERTS),
+                html_report=_REALISTIC_HTML_REPORT,
+                json_report=_REALISTIC_JSON_REPORT,
             )
-
-            # Run the workflow
-            health_result = await mcp_zap_health_check()
-            clear_result = await mcp_zap_clear_session()
-            spider_result = await mcp_zap_spider_scan("example.com")
-            active_result = await mcp_zap_active_scan("example.com")
-            alerts_result = await mcp_zap_get_alerts()
-            html_result = await mcp_zap_generate_html_report()
-            json_result = await mcp_zap_generate_json_report()
-            summary_result = await mcp_zap_scan_summary("example.com")
-
-            # Verify all steps succeeded
-            for result, is_json in [
-                (health_result, True),
-                (clear_result, True),
-                (spider_result, True),
-                (active_result, True),
-                (alerts_result, True),
-                (html_result, False),
-                (json_result, True),
-                (summary_result, True),
-            ]:
-                content = result["content"][0]["text"] if "content" in result else None
-                assert content is not None
-                if is_json:
-                    parsed = _json.loads(content)
-                    assert isinstance(parsed, dict)
-                else:
-                    assert content.strip().startswith("<!DOCTYPE html>")
-
-            # Verify URL normalization was applied
-            mock_client.spider_scan.assert_called_with("https://example.com", 5)
-            mock_client.active_scan.assert_called_with("https://example.com", None)
+        )
 
     @pytest.mark.asyncio
-    async def test_various_url_formats(self):
-        """Test various URL formats are handled correctly."""
-        test_urls = [
+    @pytest.mark.parametrize(
+        "target_url, expected_url",
+        [
+            ("example.com", "https://example.com"),
             ("api.example.com", "https://api.example.com"),
             ("example.com/path", "https://example.com/path"),
-        ]
-
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            mock_client.spider_scan.return_value = "123"
-
-            for url, expected_url in test_urls:
-                result = await mcp_zap_spider_scan(url)
-                response_data = json.loads(result["content"][0]["text"])
-                assert response_data["success"] is True
-
-                # Verify the normalized URL was used
-                mock_client.spider_scan.assert_called_with(expected_url, 5)
-
-    @pytest.mark.asyncio
-    async def test_realistic_workflow(self):
-        """Test realistic workflow based on actual scan results."""
-        with patch("src.owasp_zap_mcp.tools.zap_tools.ZAPClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            # Mock realistic responses based on actual scan
-            mock_client.health_check.return_value = True
-            mock_client.clear_session.return_value = True
-            mock_client.spider_scan.return_value = "123"
-            mock_client.active_scan.return_value = "456"
-
-            # Realistic findings (3 total: 2 Medium, 1 Informational)
-            from src.owasp_zap_mcp.zap_client import ZAPAlert, ZAPScanStatus
-
-            mock_alerts = [
-                ZAPAlert(
-                    alert_id="9",
-                    name="Missing X-Frame-Options Header",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://example.com/",
-                    description="X-Frame-Options header is not included in the response",
-                    solution="Add X-Frame-Options header",
-                    reference="",
-                    plugin_id="10009",
-                ),
-                ZAPAlert(
-                    alert_id="10",
-                    name="Content Security Policy (CSP) Header Not Set",
-                    risk="Medium",
-                    confidence="High",
-                    url="https://example.com/",
-                    description="Content Security Policy header is missing",
-                    solution="Implement Content Security Policy",
-                    reference="",
-                    plugin_id="10010",
-                ),
-                ZAPAlert(
-                    alert_id="11",
-                    name="Information Disclosure - Sensitive Information in URL",
-                    risk="Informational",
-                    confidence="Medium",
-                    url="https://example.com/contact",
-                    description="The response contains sensitive information",
-                    solution="Review information disclosure",
-                    reference="",
-                    plugin_id="10011",
-                ),
-            ]
-            mock_client.get_alerts.return_value = mock_alerts
-
-            # Mock realistic reports
-            mock_html_report = """
-            <!DOCTYPE html>
-            <html>
-            <head><title>ZAP Security Report - example.com</title></head>
-            <body>
-                <h1>Security Assessment Report</h1>
-                <h2>Target: https://example.com</h2>
-                <h3>Summary</h3>
-                <p>3 issues found: 2 Medium, 1 Informational</p>
-                <h3>Findings</h3>
-                <ul>
-                    <li>Missing X-Frame-Options Header (Medium)</li>
-                    <li>Content Security Policy Header Not Set (Medium)</li>
-                    <li>Information Disclosure (Informational)</li>
-                </ul>
-            </body>
-            </html>
-            """
-            mock_client.generate_html_report.return_value = mock_html_report
-
-            import json as _json
-
-            mock_json_report = {
-                "target": "https://example.com",
-                "alerts": [alert.__dict__ for alert in mock_alerts],
-                "total_alerts": 3,
-                "risk_breakdown": {
-                    "High": 0,
-                    "Medium": 2,
-                    "Low": 0,
-                    "Informational": 1,
-                },
-                "scan_duration_minutes": 7,
-                "timestamp": "2025-05-30T16:19:30Z",
-            }
-            mock_client.generate_json_report.return_value = _json.dumps(
-                mock_json_report
-            )
-
-            # Run the complete workflow
-            target_url = "example.com"
-
-            # Health check
-            health_result = await mcp_zap_health_check()
-            health_data = _json.loads(health_result["content"][0]["text"])
-            assert health_data["success"] is True
-
-            # Clear session
-            clear_result = await mcp_zap_clear_session()
-            clear_data = _json.loads(clear_result["content"][0]["text"])
-            assert clear_data["success"] is True
-
-            # Spider scan
-            spider_result = await mcp_zap_spider_scan(target_url)
-            spider_data = _json.loads(spider_result["content"][0]["text"])
-            assert spider_data["success"] is True
-            assert "https://example.com" in spider_data["url"]
-
-            # Active scan
-            active_result = await mcp_zap_active_scan(target_url)
-            active_data = _json.loads(active_result["content"][0]["text"])
-            assert active_data["success"] is True
-
-            # Get alerts
-            alerts_result = await mcp_zap_get_alerts()
-            alerts_data = _json.loads(alerts_result["content"][0]["text"])
-            assert alerts_data["success"] is True
-
-            # Generate reports
-            html_result = await mcp_zap_generate_html_report()
-            html_content = (
-                html_result["content"][0]["text"] if "content" in html_result else None
-            )
-            assert html_content is not None
-            assert "<!DOCTYPE html>" in html_content
+        ],
+    )
+    async def test_scan_workflow(self, workflow_client, target_url, expected_url):
+        """Test a complete scan workflow based on actual scan results."""
+        # Health check
+        health_data = _payload(await mcp_zap_health_check())
+        assert health_data["success"] is True
+
+        # Clear session
+        clear_data = _payload(await mcp_zap_clear_session())
+        assert clear_data["success"] is True
+
+        # Spider scan
+        spider_data = _payload(await mcp_zap_spider_scan(target_url))
+        assert spider_data["success"] is True
+        assert expected_url in spider_data["url"]
+
+        # Active scan
+        active_data = _payload(await mcp_zap_active_scan(target_url))
+        assert active_data["success"] is True
+
+        # Verify URL normalization was applied
+        workflow_client.spider_scan.assert_called_once_with(expected_url, 5)
+        workflow_client.active_scan.assert_called_once_with(expected_url, None)
+
+        # Get alerts
+        alerts_data = _payload(await mcp_zap_get_alerts())
+        assert alerts_data["success"] is True
+
+        # Generate reports
+        html_result = await mcp_zap_generate_html_report()
+        html_content = (
+            html_result["content"][0]["text"] if "content" in html_result else None
+        )
+        assert html_content is not None
+        assert html_content.strip().startswith("<!DOCTYPE html>")
 
-            json_result = await mcp_zap_generate_json_report()
-            json_content = (
-                json_result["content"][0]["text"] if "content" in json_result else None
-            )
-            parsed_json = _json.loads(json_content)
-            assert isinstance(parsed_json, dict)
+        json_result = await mcp_zap_generate_json_report()
+        json_content = (
+            json_result["content"][0]["text"] if "content" in json_result else None
+        )
+        assert isinstance(json.loads(json_content), dict)
 
-            # Scan summary
-            summary_result = await mcp_zap_scan_summary(target_url)
-            summary_data = _json.loads(summary_result["content"][0]["text"])
-            assert summary_data["success"] is True
+        # Scan summary
+        summary_data = _payload(await mcp_zap_scan_summary(target_url))
+        assert summary_data["success"] is True
@@ -785,6 +785,46 @@ class TestSSEServerErrorHandling:
         with pytest.raises(ValueError, match="Tool 'unknown_tool' not found"):
             await sse_server.call_tool("unknown_tool", {}, mock_request)
 
+    def test_mcp_messages_missing_session_id(self, sse_server):
+        """Test /mcp/messages rejects requests without a session_id."""
+        client = TestClient(sse_server.app)
+
+        response = client.post(
+            "/mcp/messages",
+            json={
+                "method": "tools/call",
+                "params": {"name": "zap_health_check", "arguments": {}},
+                "jsonrpc": "2.0",
+                "id": 1,
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Missing session_id parameter"}
+
+    def test_mcp_messages_unknown_tool(self, sse_server):
+        """Test an unknown tool returns a tool error, not a session error."""
+        sse_server.mcp_server.list_tools = AsyncMock(return_value=[])
+        client = TestClient(sse_server.app)
+
+        response = client.post(
+            "/mcp/messages",
+            params={"session_id": "error_test_session"},
+            json={
+                "method": "tools/call",
+                "params": {"name": "invalid_tool_name", "arguments": {}},
+                "jsonrpc": "2.0",
+                "id": 1,
+            },
+        )
+
+        # MCP returns 200 with the error in the body
+        assert response.status_code == 200
+        error = response.json()["error"]
+        assert error["code"] == -32000
+        assert "Tool 'invalid_tool_name' not found" in error["message"]
+        assert "Invalid session ID" not in error["message"]
+
     @pytest.mark.asyncio
     async def test_extract_recent_query_json_error(self, sse_server):
         """Test error handling in extract_recent_query."""
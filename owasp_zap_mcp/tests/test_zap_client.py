@@ -6,6 +6,7 @@ Basic tests to verify ZAP client functionality and API integration.
 
 import asyncio
 import json
+from dataclasses import FrozenInstanceError, asdict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -323,7 +324,7 @@ class TestZAPClient:
         zap_client.zap = MagicMock()
         zap_client.zap.core.version = "2.14.0"
         zap_client.zap.core.alerts.return_value = [
-            alert.__dict__ for alert in mock_alerts
+            asdict(alert) for alert in mock_alerts
         ]
         report = await zap_client.generate_json_report()
         import json
@@ -377,7 +378,7 @@ class TestZAPClient:
         zap_client.zap = MagicMock()
         zap_client.zap.core.version = "2.14.0"
         zap_client.zap.core.alerts.return_value = [
-            alert.__dict__ for alert in mock_alerts
+            asdict(alert) for alert in mock_alerts
         ]
         report = await zap_client.generate_json_report()
         import json
@@ -515,6 +516,25 @@ class TestZAPAlert:
         assert alert.description == ""
         assert alert.solution == ""
 
+    def test_alert_from_dict(self):
+        """Test building an alert from a raw ZAP API alert."""
+        alert = ZAPAlert.from_dict(
+            {
+                "id": "7",
+                "alert": "Cookie No HttpOnly Flag",
+                "risk": "Low",
+                "confidence": "Medium",
+                "url": "https://example.com/login",
+                "pluginId": "10010",
+            }
+        )
+
+        assert alert.alert_id == "7"
+        assert alert.name == "Cookie No HttpOnly Flag"
+        assert alert.plugin_id == "10010"
+        assert alert.description == ""
+        assert alert.reference == ""
+
     def test_alert_creation_realistic_findings(self):
         """Test creating alerts with realistic security findings."""
         # Test with a realistic security header finding
@@ -554,6 +574,23 @@ class TestZAPAlert:
         alert = ZAPAlert(**alert_data)
 
         # Test that the alert can be converted back to dict (for JSON reports)
-        alert_dict = alert.__dict__
+        alert_dict = asdict(alert)
         assert alert_dict["name"] == "Test Alert"
         assert alert_dict["risk"] == "High"
+
+    def test_alert_is_immutable(self):
+        """Test alerts are frozen so shared fixtures cannot be mutated."""
+        alert = ZAPAlert(
+            alert_id="5",
+            name="Test Alert",
+            risk="Low",
+            confidence="Medium",
+            url="https://example.com/",
+            description="Test description",
+            solution="Test solution",
+            reference="",
+            plugin_id="10005",
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            alert.risk = "High"
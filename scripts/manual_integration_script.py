@@ -47,6 +47,10 @@ TEST_TARGETS = [
     "api.github.com",       # API endpoint example
 ]
 
+# Log separators
+BANNER = "=" * 70
+SECTION_RULE = "-" * 40
+
 
 async def _test_health_endpoint(session):
     """Test the health endpoint"""
@@ -198,7 +202,7 @@ async def run_comprehensive_test():
     """Run a comprehensive test of the MCP interface"""
 
     logger.info("🧪 Starting Manual Integration Test for OWASP ZAP MCP")
-    logger.info("=" * 70)
+    logger.info(BANNER)
 
     # Test configuration
     connector = aiohttp.TCPConnector(limit=10)
@@ -211,35 +215,34 @@ async def run_comprehensive_test():
 
         test_results = []
 
-        # Test 1: Health endpoint
-        logger.info("\n1️⃣ Testing Health Endpoint")
-        logger.info("-" * 40)
-        health_ok = await _test_health_endpoint(session)
+        # Tests 1 & 2: Health and status endpoints are independent GETs,
+        # so issue them together rather than paying two round trips
+        logger.info("\n1️⃣ 2️⃣ Testing Health and Status Endpoints")
+        logger.info(SECTION_RULE)
+        health_ok, status_ok = await asyncio.gather(
+            _test_health_endpoint(session),
+            _test_status_endpoint(session),
+        )
         test_results.append(("Health Endpoint", health_ok))
+        test_results.append(("Status Endpoint", status_ok))
 
         if not health_ok:
             logger.error("❌ Health check failed - stopping tests")
             return False
 
-        # Test 2: Status endpoint
-        logger.info("\n2️⃣ Testing Status Endpoint")
-        logger.info("-" * 40)
-        status_ok = await _test_status_endpoint(session)
-        test_results.append(("Status Endpoint", status_ok))
-
         if not status_ok:
             logger.error("❌ Status check failed - stopping tests")
             return False
 
         # Test 3: Basic MCP tool (no parameters)
         logger.info("\n3️⃣ Testing Basic MCP Tool")
-        logger.info("-" * 40)
+        logger.info(SECTION_RULE)
         basic_ok = await _test_mcp_tool(session, "zap_health_check", {})
         test_results.append(("ZAP Health Check", basic_ok))
 
         # Test 4: MCP tools with URL normalization
         logger.info("\n4️⃣ Testing URL Normalization")
-        logger.info("-" * 40)
+        logger.info(SECTION_RULE)
 
         url_tests = []
         for target in TEST_TARGETS:
@@ -261,7 +264,7 @@ async def run_comprehensive_test():
 
         # Test 5: Error handling
         logger.info("\n5️⃣ Testing Error Handling")
-        logger.info("-" * 40)
+        logger.info(SECTION_RULE)
 
         # Test with invalid tool name
         invalid_tool_ok = not await _test_mcp_tool(
@@ -273,7 +276,7 @@ async def run_comprehensive_test():
 
         # Test 6: Parameter processing
         logger.info("\n6️⃣ Testing Parameter Processing")
-        logger.info("-" * 40)
+        logger.info(SECTION_RULE)
 
         param_tests = []
 
@@ -294,7 +297,7 @@ async def run_comprehensive_test():
 
         # Test 7: Report Generation
         logger.info("\n7️⃣ Generating Reports via MCP Tools")
-        logger.info("-" * 40)
+        logger.info(SECTION_RULE)
         reports_dir = Path("reports")
         reports_dir.mkdir(exist_ok=True)
         html_path = reports_dir / "owasp-zap-report.html"
@@ -320,7 +323,7 @@ async def run_comprehensive_test():
 
         # Print summary
         logger.info("\n🏁 Test Summary")
-        logger.info("=" * 70)
+        logger.info(BANNER)
 
         total_tests = len(test_results)
         passed_tests = sum(1 for _, result in test_results if result)